@@ -10,6 +10,7 @@ Copyright (c) 2022 The scenariogeneration Authors.
 
 """
 
+import copy
 import xml.etree.ElementTree as ET
 from typing import Optional, Union
 
@@ -30,6 +31,9 @@ from .exceptions import ToManyOptionalArguments
 from .links import LaneLinker, _Link, _Links
 from .utils import XodrBase
 
+# the roadmark types whose lines are adjusted by Lanes.adjust_roadmarks
+_ADJUSTABLE_MARK_TYPES = (RoadMarkType.broken, RoadMarkType.broken_broken)
+
 
 class Lanes(XodrBase):
     """Create the Lanes element of OpenDRIVE.
@@ -195,10 +199,7 @@ class Lanes(XodrBase):
         bool
             True if the roadmark can be adjusted, False otherwise.
         """
-        return (
-            lane.roadmark[0].marking_type == RoadMarkType.broken
-            or lane.roadmark[0].marking_type == RoadMarkType.broken_broken
-        )
+        return lane.roadmark[0].marking_type in _ADJUSTABLE_MARK_TYPES
 
     def _adjust_for_missing_line_offset(self, roadmark: "RoadMark") -> None:
         """Add an explicit line if the offset is less than 0 ( for adjusting
@@ -262,9 +263,7 @@ class Lanes(XodrBase):
                 self.center_lane_adjustable = False
             if (
                 self.lanesections[ls].centerlane.roadmark[0].marking_type
-                != RoadMarkType.broken
-                and self.lanesections[ls].centerlane.roadmark[0].marking_type
-                != RoadMarkType.broken_broken
+                not in _ADJUSTABLE_MARK_TYPES
             ):
                 self.center_lane_adjustable = False
 
@@ -1645,6 +1644,8 @@ class RoadMark(XodrBase):
         Add a custom road line to the RoadMark.
     add_explicit_road_line(line)
         Add an explicit road line to the RoadMark.
+    clone()
+        Create a copy of the RoadMark, including its road lines.
     get_attributes()
         Return the attributes of the RoadMark as a dictionary.
     get_element()
@@ -1764,6 +1765,35 @@ class RoadMark(XodrBase):
                 return True
         return False
 
+    def clone(self) -> "RoadMark":
+        """Create a copy of the `RoadMark`, including its road lines.
+
+        The road lines, explicit lines, user data and data quality are
+        copied as well, so the copy shares no objects with the original.
+
+        Returns
+        -------
+        RoadMark
+            A new `RoadMark` with the same attributes and lines.
+        """
+        new_roadmark = self.__class__.__new__(self.__class__)
+        new_roadmark.__dict__.update(self.__dict__)
+        # only copy what is there, an empty list or None is cheap to replace
+        if self.user_data:
+            new_roadmark.user_data = [copy.deepcopy(u) for u in self.user_data]
+        else:
+            new_roadmark.user_data = []
+        if self.data_quality is not None:
+            new_roadmark.data_quality = copy.deepcopy(self.data_quality)
+        new_roadmark._line = [line.clone() for line in self._line]
+        if self._explicit_line:
+            new_roadmark._explicit_line = [
+                copy.deepcopy(line) for line in self._explicit_line
+            ]
+        else:
+            new_roadmark._explicit_line = []
+        return new_roadmark
+
     def add_specific_road_line(self, line: "RoadLine") -> "RoadMark":
         """Add a custom road line to the RoadMark.
 
@@ -1918,6 +1948,8 @@ class RoadLine(XodrBase):
         Adjust the remainder of a broken mark for offset adjustments.
     shift_soffset()
         Shift the `soffset` by one period.
+    clone()
+        Create a copy of the `RoadLine`.
     adjust_soffset(total_length, remainder=None, previous_offset=None)
         Adjust the `soffset` of a broken mark for offset adjustments.
     get_attributes()
@@ -1972,6 +2004,27 @@ class RoadLine(XodrBase):
                 return True
         return False
 
+    def clone(self) -> "RoadLine":
+        """Create a copy of the `RoadLine`.
+
+        The user data and data quality are deep copied, so the copy shares
+        no objects with the original.
+
+        Returns
+        -------
+        RoadLine
+            A new `RoadLine` with the same attributes.
+        """
+        new_line = self.__class__.__new__(self.__class__)
+        new_line.__dict__.update(self.__dict__)
+        if self.user_data:
+            new_line.user_data = [copy.deepcopy(u) for u in self.user_data]
+        else:
+            new_line.user_data = []
+        if self.data_quality is not None:
+            new_line.data_quality = copy.deepcopy(self.data_quality)
+        return new_line
+
     def adjust_remainder(
         self,
         total_length: float,
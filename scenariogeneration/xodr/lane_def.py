@@ -13,14 +13,76 @@ Copyright (c) 2022 The scenariogeneration Authors.
 
 """
 
-import copy
 from typing import Optional, Union
 
-import numpy as np
-
-from .lane import Lane, Lanes, LaneSection, RoadLine, RoadMark, RoadMarkType
+from .lane import (
+    _ADJUSTABLE_MARK_TYPES,
+    Lane,
+    Lanes,
+    LaneSection,
+    RoadLine,
+    RoadMark,
+    RoadMarkType,
+)
 from .links import LaneLinker
-from .utils import get_coeffs_for_poly3
+from .utils import get_coeffs_for_poly3_batch
+
+
+def _create_roadmark_template(
+    marking_type: RoadMarkType,
+    width: Optional[float] = None,
+    lines: tuple[RoadLine, ...] = (),
+) -> RoadMark:
+    """Create a roadmark used as template for the standard roadmarks.
+
+    Parameters
+    ----------
+    marking_type : RoadMarkType
+        The type of marking.
+    width : float, optional
+        The width of the marking. Default is None.
+    lines : tuple of RoadLine, optional
+        The road lines to add to the roadmark. Default is ().
+
+    Returns
+    -------
+    RoadMark
+        The template `RoadMark`.
+    """
+    roadmark = RoadMark(marking_type, width)
+    for line in lines:
+        roadmark.add_specific_road_line(line)
+    return roadmark
+
+
+# the standard roadmarks are only built once, and copied when requested since
+# each lane needs its own roadmark (the lines are adjusted per lane)
+_SOLID_TEMPLATE = _create_roadmark_template(RoadMarkType.solid, 0.2)
+_BROKEN_TEMPLATE = _create_roadmark_template(
+    RoadMarkType.broken, 0.2, (RoadLine(0.15, 3, 9, 0, 0),)
+)
+_BROKEN_LONG_LINE_TEMPLATE = _create_roadmark_template(
+    RoadMarkType.broken, 0.2, (RoadLine(0.15, 9, 3, 0, 0),)
+)
+_BROKEN_TIGHT_TEMPLATE = _create_roadmark_template(
+    RoadMarkType.broken, 0.2, (RoadLine(0.15, 3, 3, 0, 0),)
+)
+_BROKEN_BROKEN_TEMPLATE = _create_roadmark_template(
+    RoadMarkType.broken_broken,
+    lines=(RoadLine(0.2, 3, 3, 0.2, 0), RoadLine(0.2, 3, 3, -0.2, 0)),
+)
+_SOLID_SOLID_TEMPLATE = _create_roadmark_template(
+    RoadMarkType.solid_solid,
+    lines=(RoadLine(0.2, 0, 0, 0.2, 0), RoadLine(0.2, 0, 0, -0.2, 0)),
+)
+_SOLID_BROKEN_TEMPLATE = _create_roadmark_template(
+    RoadMarkType.solid_broken,
+    lines=(RoadLine(0.2, 0, 0, 0.2, 0), RoadLine(0.2, 3, 3, -0.2, 0)),
+)
+_BROKEN_SOLID_TEMPLATE = _create_roadmark_template(
+    RoadMarkType.broken_solid,
+    lines=(RoadLine(0.2, 3, 3, 0.2, 0), RoadLine(0.2, 0, 0, -0.2, 0)),
+)
 
 
 def std_roadmark_solid() -> RoadMark:
@@ -33,7 +95,7 @@ def std_roadmark_solid() -> RoadMark:
     RoadMark
         A `RoadMark` object representing a solid roadmark.
     """
-    return RoadMark(RoadMarkType.solid, 0.2)
+    return _SOLID_TEMPLATE.clone()
 
 
 def std_roadmark_broken() -> RoadMark:
@@ -47,9 +109,7 @@ def std_roadmark_broken() -> RoadMark:
     RoadMark
         A `RoadMark` object representing a broken roadmark.
     """
-    roadmark = RoadMark(RoadMarkType.broken, 0.2)
-    roadmark.add_specific_road_line(RoadLine(0.15, 3, 9, 0, 0))
-    return roadmark
+    return _BROKEN_TEMPLATE.clone()
 
 
 def std_roadmark_broken_long_line() -> RoadMark:
@@ -65,9 +125,7 @@ def std_roadmark_broken_long_line() -> RoadMark:
         A `RoadMark` object representing a broken roadmark with a long
         line.
     """
-    roadmark = RoadMark(RoadMarkType.broken, 0.2)
-    roadmark.add_specific_road_line(RoadLine(0.15, 9, 3, 0, 0))
-    return roadmark
+    return _BROKEN_LONG_LINE_TEMPLATE.clone()
 
 
 def std_roadmark_broken_tight() -> RoadMark:
@@ -83,9 +141,7 @@ def std_roadmark_broken_tight() -> RoadMark:
         A `RoadMark` object representing a broken roadmark with a tight
         line pattern.
     """
-    roadmark = RoadMark(RoadMarkType.broken, 0.2)
-    roadmark.add_specific_road_line(RoadLine(0.15, 3, 3, 0, 0))
-    return roadmark
+    return _BROKEN_TIGHT_TEMPLATE.clone()
 
 
 def std_roadmark_broken_broken() -> RoadMark:
@@ -99,10 +155,7 @@ def std_roadmark_broken_broken() -> RoadMark:
     RoadMark
         A `RoadMark` object representing a broken-broken roadmark.
     """
-    roadmark = RoadMark(RoadMarkType.broken_broken)
-    roadmark.add_specific_road_line(RoadLine(0.2, 3, 3, 0.2, 0))
-    roadmark.add_specific_road_line(RoadLine(0.2, 3, 3, -0.2, 0))
-    return roadmark
+    return _BROKEN_BROKEN_TEMPLATE.clone()
 
 
 def std_roadmark_solid_solid() -> RoadMark:
@@ -116,10 +169,7 @@ def std_roadmark_solid_solid() -> RoadMark:
     RoadMark
         A `RoadMark` object representing a solid-solid roadmark.
     """
-    roadmark = RoadMark(RoadMarkType.solid_solid)
-    roadmark.add_specific_road_line(RoadLine(0.2, 0, 0, 0.2, 0))
-    roadmark.add_specific_road_line(RoadLine(0.2, 0, 0, -0.2, 0))
-    return roadmark
+    return _SOLID_SOLID_TEMPLATE.clone()
 
 
 def std_roadmark_solid_broken() -> RoadMark:
@@ -133,10 +183,7 @@ def std_roadmark_solid_broken() -> RoadMark:
     RoadMark
         A `RoadMark` object representing a solid-broken roadmark.
     """
-    roadmark = RoadMark(RoadMarkType.solid_broken)
-    roadmark.add_specific_road_line(RoadLine(0.2, 0, 0, 0.2, 0))
-    roadmark.add_specific_road_line(RoadLine(0.2, 3, 3, -0.2, 0))
-    return roadmark
+    return _SOLID_BROKEN_TEMPLATE.clone()
 
 
 def std_roadmark_broken_solid() -> RoadMark:
@@ -150,10 +197,7 @@ def std_roadmark_broken_solid() -> RoadMark:
     RoadMark
         A `RoadMark` object representing a broken-solid roadmark.
     """
-    roadmark = RoadMark(RoadMarkType.broken_solid)
-    roadmark.add_specific_road_line(RoadLine(0.2, 3, 3, 0.2, 0))
-    roadmark.add_specific_road_line(RoadLine(0.2, 0, 0, -0.2, 0))
-    return roadmark
+    return _BROKEN_SOLID_TEMPLATE.clone()
 
 
 def create_lanes_merge_split(
@@ -179,6 +223,11 @@ def create_lanes_merge_split(
     The merges and splits are defined in the road direction, not the
     driving direction.
 
+    If `center_road_mark` is not a broken (or broken-broken) roadmark, one
+    copy of it is shared by the center lanes of all lanesections. Editing
+    it on one lanesection (e.g. with `add_userdata` or
+    `add_explicit_road_line`) changes it on all of them.
+
     Parameters
     ----------
     right_lane_def : list of LaneDef or int
@@ -201,6 +250,27 @@ def create_lanes_merge_split(
     Lanes
         A `Lanes` object representing the lanes of the road.
     """
+    # the lanes only change width if lane_width_end differs from lane_width
+    width_tapers = (lane_width_end is not None) and (
+        lane_width != lane_width_end
+    )
+    if not width_tapers:
+        lane_width_end = None
+
+    if (
+        isinstance(right_lane_def, int)
+        and isinstance(left_lane_def, int)
+        and not width_tapers
+        and road_length > 0
+    ):
+        # constant number of lanes and lane width, only one lanesection needed
+        lanes = Lanes()
+        lanes.add_lanesection(
+            _create_constant_lanesection(
+                right_lane_def, left_lane_def, center_road_mark, lane_width
+            )
+        )
+        return lanes
 
     lanesections = []
     # expand the lane list
@@ -208,232 +278,53 @@ def create_lanes_merge_split(
         right_lane_def, left_lane_def, road_length, lane_width
     )
 
-    # create the lanesections needed
-    for ls in range(len(left_lane)):
+    # broken center lines are adjusted per lanesection (adjust_roadmarks),
+    # every other center roadmark can be shared between the lanesections
+    if center_road_mark.marking_type in _ADJUSTABLE_MARK_TYPES:
+        shared_center_road_mark = None
+    else:
+        shared_center_road_mark = center_road_mark.clone()
+
+    # create the lanesections needed, and the lane linker to link the lanes correctly
+    lanelinker = LaneLinker()
+    for ls, (right_def, left_def) in enumerate(zip(right_lane, left_lane)):
         lc = Lane(a=0)
-        lc.add_roadmark(copy.deepcopy(center_road_mark))
-        lsec = LaneSection(left_lane[ls].s_start, lc)
+        if shared_center_road_mark is None:
+            lc.add_roadmark(center_road_mark.clone())
+        else:
+            lc.add_roadmark(shared_center_road_mark)
+        lsec = LaneSection(left_def.s_start, lc)
         # do the right lanes
-        for i in range(
-            max(right_lane[ls].n_lanes_start, right_lane[ls].n_lanes_end)
+        for rightlane in _create_side_lanes(
+            right_def, lane_width, lane_width_end
         ):
-            # add broken roadmarks for all lanes, except for the outer lane where a solid line is added
-            if (
-                i
-                == max(
-                    right_lane[ls].n_lanes_start, right_lane[ls].n_lanes_end
-                )
-                - 1
-            ):
-                rm = std_roadmark_solid()
-            else:
-                rm = std_roadmark_broken()
-
-            # check if the number of lanes should change or not
-            if (
-                right_lane[ls].n_lanes_start > right_lane[ls].n_lanes_end
-                and i == np.abs(right_lane[ls].sub_lane) - 1
-            ):
-                # lane merge
-                coeff = get_coeffs_for_poly3(
-                    right_lane[ls].s_end - right_lane[ls].s_start,
-                    right_lane[ls].lane_start_widths[i],
-                    False,
-                    right_lane[ls].lane_end_widths[i],
-                )
-                rightlane = Lane(
-                    a=coeff[0], b=coeff[1], c=coeff[2], d=coeff[3]
-                )
-                rightlane.add_roadmark(rm)
-            elif (
-                right_lane[ls].n_lanes_start < right_lane[ls].n_lanes_end
-                and i == np.abs(right_lane[ls].sub_lane) - 1
-            ):
-                # lane split
-                coeff = get_coeffs_for_poly3(
-                    right_lane[ls].s_end - right_lane[ls].s_start,
-                    right_lane[ls].lane_start_widths[i],
-                    True,
-                    right_lane[ls].lane_end_widths[i],
-                )
-                rightlane = Lane(
-                    a=coeff[0], b=coeff[1], c=coeff[2], d=coeff[3]
-                )
-                rightlane.add_roadmark(rm)
-            elif (lane_width_end is not None) and (
-                lane_width != lane_width_end
-            ):
-                coeff = get_coeffs_for_poly3(
-                    right_lane[ls].s_end - right_lane[ls].s_start,
-                    lane_width,
-                    False,
-                    lane_width_end=lane_width_end,
-                )
-                rightlane = Lane(
-                    a=coeff[0], b=coeff[1], c=coeff[2], d=coeff[3]
-                )
-                rightlane.add_roadmark(rm)
-            elif right_lane[ls].lane_start_widths:
-                coeff = get_coeffs_for_poly3(
-                    right_lane[ls].s_end - right_lane[ls].s_start,
-                    right_lane[ls].lane_start_widths[i],
-                    False,
-                    lane_width_end=right_lane[ls].lane_end_widths[i],
-                )
-                rightlane = Lane(
-                    a=coeff[0], b=coeff[1], c=coeff[2], d=coeff[3]
-                )
-                rightlane.add_roadmark(rm)
-            else:
-                rightlane = Lane(lane_width)
-                rightlane.add_roadmark(rm)
             lsec.add_right_lane(rightlane)
 
         # do the left lanes
-        for i in range(
-            max(left_lane[ls].n_lanes_start, left_lane[ls].n_lanes_end)
+        for leftlane in _create_side_lanes(
+            left_def, lane_width, lane_width_end
         ):
-            # add broken roadmarks for all lanes, except for the outer lane where a solid line is added
-            if (
-                i
-                == max(left_lane[ls].n_lanes_start, left_lane[ls].n_lanes_end)
-                - 1
-            ):
-                rm = std_roadmark_solid()
-            else:
-                rm = std_roadmark_broken()
+            lsec.add_left_lane(leftlane)
 
-            # check if the number of lanes should change or not
-            if (
-                left_lane[ls].n_lanes_start < left_lane[ls].n_lanes_end
-                and i == left_lane[ls].sub_lane - 1
+        # link the lanes to the previous lanesection
+        if ls > 0:
+            previous_lsec = lanesections[-1]
+            for j_previous, j_current in _get_lane_link_indices(
+                right_lane[ls - 1], right_def
             ):
-                # lane split
-                coeff = get_coeffs_for_poly3(
-                    left_lane[ls].s_end - left_lane[ls].s_start,
-                    left_lane[ls].lane_start_widths[i],
-                    True,
-                    left_lane[ls].lane_end_widths[i],
-                )
-                leftlane = Lane(a=coeff[0], b=coeff[1], c=coeff[2], d=coeff[3])
-                leftlane.add_roadmark(rm)
-            elif (
-                left_lane[ls].n_lanes_start > left_lane[ls].n_lanes_end
-                and i == left_lane[ls].sub_lane - 1
-            ):
-                # lane merge
-                coeff = get_coeffs_for_poly3(
-                    left_lane[ls].s_end - left_lane[ls].s_start,
-                    left_lane[ls].lane_start_widths[i],
-                    False,
-                    left_lane[ls].lane_end_widths[i],
+                lanelinker.add_link(
+                    previous_lsec.rightlanes[j_previous],
+                    lsec.rightlanes[j_current],
                 )
-                leftlane = Lane(a=coeff[0], b=coeff[1], c=coeff[2], d=coeff[3])
-                leftlane.add_roadmark(rm)
-            elif (lane_width_end is not None) and (
-                lane_width != lane_width_end
+            for j_previous, j_current in _get_lane_link_indices(
+                left_lane[ls - 1], left_def
             ):
-                coeff = get_coeffs_for_poly3(
-                    left_lane[ls].s_end - left_lane[ls].s_start,
-                    lane_width,
-                    False,
-                    lane_width_end=lane_width_end,
-                )
-                leftlane = Lane(a=coeff[0], b=coeff[1], c=coeff[2], d=coeff[3])
-                leftlane.add_roadmark(rm)
-            elif left_lane[ls].lane_start_widths:
-                coeff = get_coeffs_for_poly3(
-                    left_lane[ls].s_end - left_lane[ls].s_start,
-                    left_lane[ls].lane_start_widths[i],
-                    False,
-                    lane_width_end=left_lane[ls].lane_end_widths[i],
-                )
-                leftlane = Lane(a=coeff[0], b=coeff[1], c=coeff[2], d=coeff[3])
-                leftlane.add_roadmark(rm)
-            else:
-                leftlane = Lane(lane_width)
-                leftlane.add_roadmark(rm)
-            lsec.add_left_lane(leftlane)
-
-        lanesections.append(lsec)
-
-    # create the lane linker to link the lanes correctly
-    lanelinker = LaneLinker()
-    for i in range(1, len(right_lane)):
-        if right_lane[i].n_lanes_end > right_lane[i].n_lanes_start:
-            # lane split
-            for j in range(0, right_lane[i - 1].n_lanes_end + 1):
-                # adjust for the new lane
-                if right_lane[i].sub_lane < -(j + 1):
-                    lanelinker.add_link(
-                        lanesections[i - 1].rightlanes[j],
-                        lanesections[i].rightlanes[j],
-                    )
-                elif right_lane[i].sub_lane > -(j + 1):
-                    lanelinker.add_link(
-                        lanesections[i - 1].rightlanes[j - 1],
-                        lanesections[i].rightlanes[j],
-                    )
-        elif right_lane[i - 1].n_lanes_end < right_lane[i - 1].n_lanes_start:
-            # lane merge
-            for j in range(0, right_lane[i - 1].n_lanes_end + 1):
-                # adjust for the lost lane
-                if right_lane[i - 1].sub_lane < -(j + 1):
-                    lanelinker.add_link(
-                        lanesections[i - 1].rightlanes[j],
-                        lanesections[i].rightlanes[j],
-                    )
-                elif right_lane[i - 1].sub_lane > -(j + 1):
-                    lanelinker.add_link(
-                        lanesections[i - 1].rightlanes[j],
-                        lanesections[i].rightlanes[j - 1],
-                    )
-
-        else:
-            # same number of lanes, just add the links
-            for j in range(right_lane[i - 1].n_lanes_end):
                 lanelinker.add_link(
-                    lanesections[i - 1].rightlanes[j],
-                    lanesections[i].rightlanes[j],
+                    previous_lsec.leftlanes[j_previous],
+                    lsec.leftlanes[j_current],
                 )
 
-    for i in range(1, len(left_lane)):
-        if left_lane[i].n_lanes_end > left_lane[i].n_lanes_start:
-            # lane split
-            for j in range(0, left_lane[i - 1].n_lanes_end + 1):
-                # adjust for the new lane
-                if left_lane[i].sub_lane < (j + 1):
-                    lanelinker.add_link(
-                        lanesections[i - 1].leftlanes[j - 1],
-                        lanesections[i].leftlanes[j],
-                    )
-                elif left_lane[i].sub_lane > (j + 1):
-                    lanelinker.add_link(
-                        lanesections[i - 1].leftlanes[j],
-                        lanesections[i].leftlanes[j],
-                    )
-        elif left_lane[i - 1].n_lanes_end < left_lane[i - 1].n_lanes_start:
-            # lane merge
-            for j in range(0, left_lane[i - 1].n_lanes_end + 1):
-                # adjust for the lost lane
-                if left_lane[i - 1].sub_lane < (j + 1):
-                    lanelinker.add_link(
-                        lanesections[i - 1].leftlanes[j],
-                        lanesections[i].leftlanes[j - 1],
-                    )
-                elif left_lane[i - 1].sub_lane > (j + 1):
-                    lanelinker.add_link(
-                        lanesections[i - 1].leftlanes[j],
-                        lanesections[i].leftlanes[j],
-                    )
-
-        else:
-            # same number of lanes, just add the links
-            for j in range(left_lane[i - 1].n_lanes_end):
-                lanelinker.add_link(
-                    lanesections[i - 1].leftlanes[j],
-                    lanesections[i].leftlanes[j],
-                )
+        lanesections.append(lsec)
 
     # Add the lanesections to the lanes struct together the lanelinker
     lanes = Lanes()
@@ -442,6 +333,190 @@ def create_lanes_merge_split(
     return lanes
 
 
+def _create_constant_lanesection(
+    n_right_lanes: int,
+    n_left_lanes: int,
+    center_road_mark: RoadMark,
+    lane_width: float,
+) -> LaneSection:
+    """Create the lanesection of a road with a constant number of lanes.
+
+    This function is the fast path of `create_lanes_merge_split` for roads
+    where the number of lanes and the lane width do not change, so there
+    is no need to expand any `LaneDef`.
+
+    Parameters
+    ----------
+    n_right_lanes : int
+        The number of lanes on the right side of the road.
+    n_left_lanes : int
+        The number of lanes on the left side of the road.
+    center_road_mark : RoadMark
+        The roadmark for the center line.
+    lane_width : float
+        The width of the lanes.
+
+    Returns
+    -------
+    LaneSection
+        The `LaneSection` covering the whole road.
+    """
+    lc = Lane(a=0)
+    lc.add_roadmark(center_road_mark.clone())
+    lsec = LaneSection(0, lc)
+    for n_lanes, add_lane in [
+        (n_right_lanes, lsec.add_right_lane),
+        (n_left_lanes, lsec.add_left_lane),
+    ]:
+        for roadmark in _create_side_roadmarks(n_lanes):
+            lane = Lane(a=lane_width)
+            lane.add_roadmark(roadmark)
+            add_lane(lane)
+    return lsec
+
+
+def _create_side_roadmarks(n_lanes: int) -> list[RoadMark]:
+    """Create the roadmarks of the lanes of one side of a lanesection.
+
+    Parameters
+    ----------
+    n_lanes : int
+        The number of lanes on the side.
+
+    Returns
+    -------
+    list of RoadMark
+        One roadmark per lane, ordered from the center lane and outwards.
+    """
+    # add broken roadmarks for all lanes, except for the outer lane where a solid line is added
+    return [
+        (
+            _SOLID_TEMPLATE.clone()
+            if i == n_lanes - 1
+            else _BROKEN_TEMPLATE.clone()
+        )
+        for i in range(n_lanes)
+    ]
+
+
+def _create_side_lanes(
+    lane_def: "LaneDef",
+    lane_width: float,
+    lane_width_end: Optional[float] = None,
+) -> list[Lane]:
+    """Create the lanes of one side of a lanesection.
+
+    This function is used by `create_lanes_merge_split`. The start and end
+    width of every lane is decided first, then the width polynomials of
+    all lanes are calculated at once.
+
+    Parameters
+    ----------
+    lane_def : LaneDef
+        The (expanded) `LaneDef` of the side of the lanesection.
+    lane_width : float
+        The width of the lanes.
+    lane_width_end : float, optional
+        The width of the lanes at the end of the road, only given if it
+        differs from `lane_width`. Default is None.
+
+    Returns
+    -------
+    list of Lane
+        The lanes of the side, ordered from the center lane and outwards.
+
+    Raises
+    ------
+    ValueError
+        If the lane widths of `lane_def` do not match its number of lanes.
+    """
+    n_lanes_start = lane_def.n_lanes_start
+    n_lanes_end = lane_def.n_lanes_end
+    lane_start_widths = lane_def.lane_start_widths
+    lane_end_widths = lane_def.lane_end_widths
+    n_lanes = n_lanes_start if n_lanes_start > n_lanes_end else n_lanes_end
+
+    # the lane that is created (split) or removed (merge), the sign of
+    # sub_lane is ignored on both sides, as in LaneDef._adjust_lane_widths
+    if n_lanes_start != n_lanes_end:
+        changing_lane = abs(lane_def.sub_lane) - 1
+    else:
+        changing_lane = None
+
+    if lane_start_widths:
+        if not len(lane_start_widths) == len(lane_end_widths) == n_lanes:
+            raise ValueError(
+                "The number of lane widths does not match the number of lanes."
+            )
+        start_widths = lane_start_widths
+        end_widths = lane_end_widths
+    else:
+        start_widths = end_widths = [lane_width] * n_lanes
+
+    if lane_width_end is not None:
+        # all lanes, except a changing one, go from lane_width to lane_width_end
+        tapered_start_widths = [lane_width] * n_lanes
+        tapered_end_widths = [lane_width_end] * n_lanes
+        if changing_lane is not None:
+            tapered_start_widths[changing_lane] = start_widths[changing_lane]
+            tapered_end_widths[changing_lane] = end_widths[changing_lane]
+        start_widths = tapered_start_widths
+        end_widths = tapered_end_widths
+
+    coeffs = get_coeffs_for_poly3_batch(
+        lane_def.s_end - lane_def.s_start, start_widths, end_widths
+    )
+
+    lanes = []
+    for (a, b, c, d), roadmark in zip(
+        coeffs.tolist(), _create_side_roadmarks(n_lanes)
+    ):
+        lane = Lane(a=a, b=b, c=c, d=d)
+        lane.add_roadmark(roadmark)
+        lanes.append(lane)
+    return lanes
+
+
+def _get_lane_link_indices(
+    previous_lane_def: "LaneDef", lane_def: "LaneDef"
+) -> list[tuple[int, int]]:
+    """Get which lanes to link between two following lanesections.
+
+    This function is used by `create_lanes_merge_split`, and works for
+    both the right and the left side. Only the absolute value of
+    `sub_lane` is used, the same way as `LaneDef` uses it for the lane
+    widths, so the sign of `sub_lane` does not change the links.
+
+    Parameters
+    ----------
+    previous_lane_def : LaneDef
+        The (expanded) `LaneDef` of the previous lanesection.
+    lane_def : LaneDef
+        The (expanded) `LaneDef` of the lanesection to link to.
+
+    Returns
+    -------
+    list of tuple of (int, int)
+        The index of the lane in the previous lanesection and the index of
+        the lane it is linked to in the lanesection.
+    """
+    n_lanes = previous_lane_def.n_lanes_end + 1
+    if lane_def.n_lanes_end > lane_def.n_lanes_start:
+        # lane split, the new lane has no predecessor
+        new_lane = abs(lane_def.sub_lane) - 1
+        return [(j, j) for j in range(min(new_lane, n_lanes))] + [
+            (j - 1, j) for j in range(new_lane + 1, n_lanes)
+        ]
+    if previous_lane_def.n_lanes_end < previous_lane_def.n_lanes_start:
+        # lane merge, the lost lane has no successor
+        lost_lane = abs(previous_lane_def.sub_lane) - 1
+        return [(j, j) for j in range(min(lost_lane, n_lanes))] + [
+            (j, j - 1) for j in range(lost_lane + 1, n_lanes)
+        ]
+    # same number of lanes, just add the links
+    return [(j, j) for j in range(previous_lane_def.n_lanes_end)]
+
+
 class LaneDef:
     """Helper class to define a lane merge or split.
 
@@ -463,7 +538,7 @@ class LaneDef:
         Default is None.
     lane_start_widths : list of float, optional
         The widths of lanes at the start. Must be empty or the same length
-        as `n_lanes_start`. Default is an empty list.
+        as `n_lanes_start`. Default is None (no widths).
     lane_end_widths : list of float, optional
         The widths of lanes at the end. Must be empty or the same length
         as `n_lanes_end`. Default is the same as `lane_start_widths`.
@@ -486,6 +561,16 @@ class LaneDef:
         The widths of lanes at the end.
     """
 
+    __slots__ = (
+        "s_start",
+        "s_end",
+        "n_lanes_start",
+        "n_lanes_end",
+        "sub_lane",
+        "lane_start_widths",
+        "lane_end_widths",
+    )
+
     def __init__(
         self,
         s_start: float,
@@ -493,8 +578,8 @@ class LaneDef:
         n_lanes_start: int,
         n_lanes_end: int,
         sub_lane: Optional[int] = None,
-        lane_start_widths: Optional[list[float]] = [],
-        lane_end_widths: Optional[list[float]] = [],
+        lane_start_widths: Optional[list[float]] = None,
+        lane_end_widths: Optional[list[float]] = None,
     ) -> None:
         """Initialize a `LaneDef` instance.
 
@@ -513,7 +598,7 @@ class LaneDef:
             Default is None.
         lane_start_widths : list of float, optional
             The widths of lanes at the start. Must be empty or the same
-            length as `n_lanes_start`. Default is an empty list.
+            length as `n_lanes_start`. Default is None (no widths).
         lane_end_widths : list of float, optional
             The widths of lanes at the end. Must be empty or the same
             length as `n_lanes_end`. Default is the same as
@@ -528,8 +613,10 @@ class LaneDef:
         self.n_lanes_start = n_lanes_start
         self.n_lanes_end = n_lanes_end
         self.sub_lane = sub_lane
-        self.lane_start_widths = lane_start_widths
-        if lane_end_widths == []:
+        self.lane_start_widths = (
+            [] if lane_start_widths is None else lane_start_widths
+        )
+        if not lane_end_widths:
             self.lane_end_widths = self.lane_start_widths.copy()
         else:
             self.lane_end_widths = lane_end_widths
@@ -544,19 +631,18 @@ class LaneDef:
         -------
         None
         """
-        if self.sub_lane:
-            if (
-                self.lane_end_widths
-                and len(self.lane_end_widths) < self.n_lanes_start
-            ):
+        sub_lane = self.sub_lane
+        if sub_lane:
+            lane_start_widths = self.lane_start_widths
+            lane_end_widths = self.lane_end_widths
+            if lane_end_widths and len(lane_end_widths) < self.n_lanes_start:
                 # mergeo
-                self.lane_end_widths.insert(abs(self.sub_lane) - 1, 0)
+                lane_end_widths.insert(abs(sub_lane) - 1, 0)
             elif (
-                self.lane_start_widths
-                and len(self.lane_start_widths) < self.n_lanes_end
+                lane_start_widths and len(lane_start_widths) < self.n_lanes_end
             ):
                 # split
-                self.lane_start_widths.insert(abs(self.sub_lane) - 1, 0)
+                lane_start_widths.insert(abs(sub_lane) - 1, 0)
         # TODO: add some checks here?
 
 
@@ -603,13 +689,48 @@ def _create_lane_lists(
             The `LaneDef` object to check and adjust.
         """
         if lane.lane_start_widths == []:
-            lane.lane_start_widths = [
-                default_lane_width for x in range(lane.n_lanes_start)
-            ]
+            lane.lane_start_widths = [default_lane_width] * lane.n_lanes_start
         if lane.lane_end_widths == []:
-            lane.lane_end_widths = [
-                default_lane_width for x in range(lane.n_lanes_end)
-            ]
+            lane.lane_end_widths = [default_lane_width] * lane.n_lanes_end
+
+    def _constant_lane_def(
+        s_start: float,
+        s_end: float,
+        n_lanes: int,
+        widths: Optional[list[float]] = None,
+    ) -> LaneDef:
+        """Create a `LaneDef` with a constant number of lanes and widths.
+
+        Parameters
+        ----------
+        s_start : float
+            The `s` coordinate of the start of the `LaneDef`.
+        s_end : float
+            The `s` coordinate of the end of the `LaneDef`.
+        n_lanes : int
+            The number of lanes.
+        widths : list of float, optional
+            The widths of the lanes (copied to the `LaneDef`). Default is
+            None, which uses the default lane width for all lanes.
+
+        Returns
+        -------
+        LaneDef
+            The new `LaneDef`.
+        """
+        if widths:
+            # widths of a neighbouring LaneDef, which must not be shared
+            start_widths = list(widths)
+        else:
+            start_widths = [default_lane_width] * n_lanes
+        return LaneDef(
+            s_start,
+            s_end,
+            n_lanes,
+            n_lanes,
+            lane_start_widths=start_widths,
+            lane_end_widths=list(start_widths),
+        )
 
     const_right_lanes = None
     const_left_lanes = None
@@ -630,8 +751,14 @@ def _create_lane_lists(
         const_left_lanes = left
         left = []
 
+    # the amount of lanes used after the last LaneDef does not change
+    n_right_defs = len(right)
+    n_left_defs = len(left)
+    n_r_lanes_after = right[-1].n_lanes_end if right else const_right_lanes
+    n_l_lanes_after = left[-1].n_lanes_end if left else const_left_lanes
+
     while present_s < tot_length:
-        if r_it < len(right):
+        if r_it < n_right_defs:
             # check if there is still a right LaneDef to be used, and is the next one to add
             if right[r_it].s_start == present_s:
                 add_right = True
@@ -643,12 +770,9 @@ def _create_lane_lists(
             # no more LaneDefs, just add new right lanes with the const/or last number of lanes
             add_right = False
             next_right = tot_length
-            if const_right_lanes or const_right_lanes == 0:
-                n_r_lanes = const_right_lanes
-            else:
-                n_r_lanes = right[-1].n_lanes_end
+            n_r_lanes = n_r_lanes_after
 
-        if l_it < len(left):
+        if l_it < n_left_defs:
             # check if there is still a left LaneDef to be used, and is the next one to add
             if left[l_it].s_start == present_s:
                 add_left = True
@@ -660,100 +784,42 @@ def _create_lane_lists(
             # no more LaneDefs, just add new left lanes with the const/or last number of lanes
             add_left = False
             next_left = tot_length
-            if const_left_lanes or const_left_lanes == 0:
-                n_l_lanes = const_left_lanes
-            else:
-                n_l_lanes = left[-1].n_lanes_end
+            n_l_lanes = n_l_lanes_after
 
         # create and add the requiered LaneDefs
         if not add_left and not add_right:
             # no LaneDefs, just add same amout of lanes
             s_end = min(next_left, next_right)
-            if const_right_lanes is not None:
-                retlanes_right.append(
-                    LaneDef(
-                        present_s,
-                        s_end,
-                        n_r_lanes,
-                        n_r_lanes,
-                        lane_start_widths=[
-                            default_lane_width for x in range(n_r_lanes)
-                        ],
-                        lane_end_widths=[
-                            default_lane_width for x in range(n_r_lanes)
-                        ],
-                    )
-                )
-            else:
-                lane_start_widths = [
-                    default_lane_width for x in range(n_r_lanes)
-                ]
-                lane_end_widths = [
-                    default_lane_width for x in range(n_r_lanes)
-                ]
-                if r_it == len(right):
-                    if right[r_it - 1].lane_end_widths:
-                        lane_start_widths = right[
-                            r_it - 1
-                        ].lane_end_widths.copy()
-                        lane_end_widths = right[
-                            r_it - 1
-                        ].lane_end_widths.copy()
-                elif right[r_it].lane_start_widths:
-                    lane_start_widths = right[r_it].lane_start_widths.copy()
-                    lane_end_widths = right[r_it].lane_start_widths.copy()
-                retlanes_right.append(
-                    LaneDef(
-                        present_s,
-                        s_end,
-                        n_r_lanes,
-                        n_r_lanes,
-                        lane_start_widths=lane_start_widths,
-                        lane_end_widths=lane_end_widths,
-                    )
-                )
-            if const_left_lanes is not None:
-                retlanes_left.append(
-                    LaneDef(
-                        present_s,
-                        s_end,
-                        n_l_lanes,
-                        n_l_lanes,
-                        lane_start_widths=[
-                            default_lane_width for x in range(n_l_lanes)
-                        ],
-                        lane_end_widths=[
-                            default_lane_width for x in range(n_l_lanes)
-                        ],
-                    )
+            # reuse the widths of the neighbouring LaneDef if there is one
+            right_widths = None
+            if const_right_lanes is None:
+                if r_it == n_right_defs:
+                    right_widths = right[r_it - 1].lane_end_widths
+                else:
+                    right_widths = right[r_it].lane_start_widths
+            retlanes_right.append(
+                _constant_lane_def(
+                    present_s,
+                    s_end,
+                    n_r_lanes,
+                    right_widths,
                 )
-            else:
-                lane_start_widths = [
-                    default_lane_width for x in range(n_l_lanes)
-                ]
-                lane_end_widths = [
-                    default_lane_width for x in range(n_l_lanes)
-                ]
-                if l_it == len(left):
-                    if left[l_it - 1].lane_end_widths:
-                        lane_start_widths = left[
-                            l_it - 1
-                        ].lane_end_widths.copy()
-                        lane_end_widths = left[l_it - 1].lane_end_widths.copy()
-                elif left[l_it].lane_start_widths:
-                    lane_start_widths = left[l_it].lane_start_widths.copy()
-                    lane_end_widths = left[l_it].lane_start_widths.copy()
-
-                retlanes_left.append(
-                    LaneDef(
-                        present_s,
-                        s_end,
-                        n_l_lanes,
-                        n_l_lanes,
-                        lane_start_widths=lane_start_widths,
-                        lane_end_widths=lane_end_widths,
-                    )
+            )
+
+            left_widths = None
+            if const_left_lanes is None:
+                if l_it == n_left_defs:
+                    left_widths = left[l_it - 1].lane_end_widths
+                else:
+                    left_widths = left[l_it].lane_start_widths
+            retlanes_left.append(
+                _constant_lane_def(
+                    present_s,
+                    s_end,
+                    n_l_lanes,
+                    left_widths,
                 )
+            )
 
             present_s = s_end
         elif add_left and add_right:
@@ -770,17 +836,10 @@ def _create_lane_lists(
             _check_lane_widths(right[r_it])
             retlanes_right.append(right[r_it])
             retlanes_left.append(
-                LaneDef(
+                _constant_lane_def(
                     present_s,
                     right[r_it].s_end,
                     n_l_lanes,
-                    n_l_lanes,
-                    lane_start_widths=[
-                        default_lane_width for x in range(n_l_lanes)
-                    ],
-                    lane_end_widths=[
-                        default_lane_width for x in range(n_l_lanes)
-                    ],
                 )
             )
             present_s = right[r_it].s_end
@@ -790,21 +849,16 @@ def _create_lane_lists(
             _check_lane_widths(left[l_it])
             retlanes_left.append(left[l_it])
             retlanes_right.append(
-                LaneDef(
+                _constant_lane_def(
                     present_s,
                     left[l_it].s_end,
                     n_r_lanes,
-                    n_r_lanes,
-                    lane_start_widths=[
-                        default_lane_width for x in range(n_r_lanes)
-                    ],
-                    lane_end_widths=[
-                        default_lane_width for x in range(n_r_lanes)
-                    ],
                 )
             )
             present_s = left[l_it].s_end
             l_it += 1
-    [x._adjust_lane_widths() for x in retlanes_right]
-    [x._adjust_lane_widths() for x in retlanes_left]
+    for lane_def in retlanes_right:
+        lane_def._adjust_lane_widths()
+    for lane_def in retlanes_left:
+        lane_def._adjust_lane_widths()
     return retlanes_right, retlanes_left
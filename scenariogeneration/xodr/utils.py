@@ -11,7 +11,7 @@ Copyright (c) 2022 The scenariogeneration Authors.
 """
 
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 
@@ -111,6 +111,55 @@ def get_coeffs_for_poly3(
     return np.linalg.solve(A, B)
 
 
+def get_coeffs_for_poly3_batch(
+    lengths: Union[float, np.ndarray],
+    w_start: Union[list[float], np.ndarray],
+    w_end: Union[list[float], np.ndarray],
+) -> np.ndarray:
+    """Create the coefficients for multiple third-degree polynomials at
+    once.
+
+    Assumes that the derivative is 0 at the start and end of each segment,
+    which gives the closed form solution a = w_start, b = 0,
+    c = 3 * (w_end - w_start) / length^2 and
+    d = -2 * (w_end - w_start) / length^3.
+
+    Parameters
+    ----------
+    lengths : float or np.ndarray
+        Length(s) of the segments in the s-direction.
+    w_start : list[float] or np.ndarray
+        The widths at the start of the segments.
+    w_end : list[float] or np.ndarray
+        The widths at the end of the segments.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (N, 4) with the polynomial coefficients
+        corresponding to "a, b, c, d" in the OpenDRIVE polynomials.
+
+    Raises
+    ------
+    ValueError
+        If any of the lengths is not larger than 0, or if `w_start` and
+        `w_end` do not have the same shape.
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    if np.any(lengths <= 0):
+        raise ValueError("The length of the segments has to be larger than 0.")
+    w_start = np.asarray(w_start, dtype=float)
+    w_end = np.asarray(w_end, dtype=float)
+    if w_start.shape != w_end.shape:
+        raise ValueError("w_start and w_end must have the same shape.")
+    delta = w_end - w_start
+    coeffs = np.zeros((w_start.size, 4))
+    coeffs[:, 0] = w_start
+    coeffs[:, 2] = 3 * delta / lengths**2
+    coeffs[:, 3] = -2 * delta / lengths**3
+    return coeffs
+
+
 class XodrBase:
     """Sets up common functionality for xodr-generating classes by enabling
     userdata inputs.
@@ -152,6 +152,41 @@ def test_roadmark():
         xodr.RoadMark("solid", laneChange="dummy")
 
 
+def test_roadmark_clone():
+    mark = xodr.RoadMark(xodr.RoadMarkType.solid_broken)
+    mark.add_specific_road_line(xodr.RoadLine(0.2, 0, 0, 0.2, 0))
+    mark.add_specific_road_line(xodr.RoadLine(0.2, 3, 3, -0.2, 0))
+    mark.add_userdata(xodr.UserData("stuffs", "morestuffs"))
+    mark_clone = mark.clone()
+    assert mark == mark_clone
+    assert mark_clone._line[1] is not mark._line[1]
+    assert mark_clone._line[1] == mark._line[1].clone()
+    mark_clone.add_explicit_road_line(xodr.ExplicitRoadLine(1, 2, 3, 4))
+    assert mark._explicit_line == []
+    mark_clone._line[1].shift_soffset()
+    assert mark._line[1].soffset == 0
+    assert mark_clone._line[1] != mark._line[1]
+
+
+def test_roadmark_clone_shares_no_objects():
+    dq = xodr.DataQuality()
+    dq.add_error(0.1, 0.2, 0.3, 0.4)
+    mark = xodr.RoadMark(xodr.RoadMarkType.broken)
+    mark.add_specific_road_line(xodr.RoadLine(0.2, 3, 9, 0, 0))
+    mark.add_explicit_road_line(xodr.ExplicitRoadLine(1, 2, 3, 4))
+    mark.add_userdata(xodr.UserData("stuffs", "morestuffs"))
+    mark.add_dataquality(dq)
+    mark._line[0].add_dataquality(dq)
+    mark_clone = mark.clone()
+    assert mark == mark_clone
+    assert mark_clone.data_quality is not mark.data_quality
+    assert mark_clone._explicit_line[0] is not mark._explicit_line[0]
+    assert mark_clone.user_data[0] is not mark.user_data[0]
+    assert mark_clone._line[0].data_quality is not mark._line[0].data_quality
+    mark_clone._explicit_line[0].soffset = 10
+    assert mark._explicit_line[0].soffset == 4
+
+
 def test_poly3struct():
     ps1 = xodr.lane._poly3struct(1, 2, 3, 4, 5)
     ps2 = xodr.lane._poly3struct(1, 2, 3, 4, 5)
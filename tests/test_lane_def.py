@@ -1,3 +1,5 @@
+import pytest
+
 from scenariogeneration import xodr, prettyprint
 
 
@@ -87,3 +89,235 @@ def test_create_lane_lists_lane_def_no_widths_left():
     assert left_lanes[1].lane_start_widths == [3, 0, 3, 3]
     assert left_lanes[1].lane_end_widths == [3, 3, 3, 3]
     assert right_lanes[1].lane_start_widths == [3, 3, 3]
+
+
+def test_std_roadmarks_are_independent():
+    mark1 = xodr.std_roadmark_broken()
+    mark2 = xodr.std_roadmark_broken()
+    assert mark1 == mark2
+    assert mark1 is not mark2
+    mark1._line[0].shift_soffset()
+    assert mark1 != mark2
+    assert xodr.std_roadmark_broken() == mark2
+    assert xodr.std_roadmark_solid_solid() == xodr.std_roadmark_solid_solid()
+
+
+def test_create_lanes_merge_split_changing_lane_with_lane_width_end():
+    lanes = xodr.create_lanes_merge_split(
+        [xodr.LaneDef(0, 100, 1, 2, -2)],
+        1,
+        100,
+        xodr.std_roadmark_solid(),
+        3,
+        4,
+    )
+    right_lanes = lanes.lanesections[0].rightlanes
+    assert len(right_lanes) == 2
+    assert right_lanes[0].get_width(0) == pytest.approx(3)
+    assert right_lanes[0].get_width(100) == pytest.approx(4)
+    assert right_lanes[1].get_width(0) == pytest.approx(0)
+    assert right_lanes[1].get_width(100) == pytest.approx(3)
+    assert right_lanes[0].roadmark[0] == xodr.std_roadmark_broken()
+    assert right_lanes[1].roadmark[0] == xodr.std_roadmark_solid()
+    left_lanes = lanes.lanesections[0].leftlanes
+    assert left_lanes[0].get_width(100) == pytest.approx(4)
+
+
+@pytest.mark.parametrize("sub_lane", [2, -2])
+def test_create_lanes_merge_split_left_changing_lane_with_lane_width_end(
+    sub_lane,
+):
+    lanes = xodr.create_lanes_merge_split(
+        1,
+        [xodr.LaneDef(0, 100, 1, 2, sub_lane)],
+        100,
+        xodr.std_roadmark_solid(),
+        3,
+        4,
+    )
+    left_lanes = lanes.lanesections[0].leftlanes
+    assert len(left_lanes) == 2
+    assert left_lanes[0].get_width(0) == pytest.approx(3)
+    assert left_lanes[0].get_width(100) == pytest.approx(4)
+    assert left_lanes[1].get_width(0) == pytest.approx(0)
+    assert left_lanes[1].get_width(100) == pytest.approx(3)
+
+
+@pytest.mark.parametrize(
+    "lane_def",
+    [
+        xodr.LaneDef(0, 100, 2, 2, lane_start_widths=[3.5]),
+        xodr.LaneDef(
+            0, 100, 2, 2, lane_start_widths=[3, 3], lane_end_widths=[4]
+        ),
+        xodr.LaneDef(0, 100, 2, 2, lane_start_widths=[3, 3, 3]),
+    ],
+)
+def test_create_lanes_merge_split_wrong_number_of_widths(lane_def):
+    with pytest.raises(ValueError):
+        xodr.create_lanes_merge_split(
+            [lane_def], 1, 100, xodr.std_roadmark_solid(), 3
+        )
+
+
+@pytest.mark.parametrize(
+    "lane_def", [xodr.LaneDef(0, 0, 2, 2), xodr.LaneDef(50, 50, 2, 3, -2)]
+)
+def test_create_lanes_merge_split_zero_length_lane_def(lane_def):
+    with pytest.raises(ValueError):
+        xodr.create_lanes_merge_split(
+            [lane_def], 1, 100, xodr.std_roadmark_solid(), 3
+        )
+
+
+def test_create_lane_lists_widths_are_not_shared():
+    right_lanes, left_lanes = xodr.lane_def._create_lane_lists(
+        [xodr.LaneDef(10, 90, 3, 2, -2)], 3, 100, 3
+    )
+    assert right_lanes[0].lane_end_widths == [3, 3, 3]
+    assert right_lanes[1].lane_end_widths == [3, 0, 3]
+    assert right_lanes[2].lane_start_widths == [3, 3]
+    all_widths = [
+        widths
+        for lane in right_lanes + left_lanes
+        for widths in (lane.lane_start_widths, lane.lane_end_widths)
+    ]
+    assert len(set(id(widths) for widths in all_widths)) == len(all_widths)
+
+
+def test_lane_def_default_widths_not_shared():
+    lane_def1 = xodr.LaneDef(0, 10, 2, 3, -1)
+    lane_def2 = xodr.LaneDef(0, 10, 2, 3, -1)
+    assert lane_def1.lane_start_widths == []
+    assert lane_def1.lane_end_widths == []
+    lane_def1.lane_start_widths.append(3)
+    assert lane_def2.lane_start_widths == []
+    assert lane_def1.lane_start_widths is not lane_def1.lane_end_widths
+
+
+def test_get_lane_link_indices():
+    constant = xodr.LaneDef(0, 10, 2, 2)
+    split = xodr.LaneDef(10, 20, 2, 3, -2)
+    merge = xodr.LaneDef(10, 20, 3, 2, 2)
+    assert xodr.lane_def._get_lane_link_indices(constant, constant) == [
+        (0, 0),
+        (1, 1),
+    ]
+    assert xodr.lane_def._get_lane_link_indices(constant, split) == [
+        (0, 0),
+        (1, 2),
+    ]
+    assert xodr.lane_def._get_lane_link_indices(merge, constant) == [
+        (0, 0),
+        (2, 1),
+    ]
+
+
+@pytest.mark.parametrize("sub_lane", [2, -2])
+def test_create_lanes_merge_split_split_links(sub_lane):
+    lanes = xodr.create_lanes_merge_split(
+        [xodr.LaneDef(10, 20, 2, 3, -abs(sub_lane))],
+        [xodr.LaneDef(10, 20, 2, 3, abs(sub_lane))],
+        30,
+        xodr.std_roadmark_solid(),
+        3,
+    )
+    lanes_wrong_sign = xodr.create_lanes_merge_split(
+        [xodr.LaneDef(10, 20, 2, 3, sub_lane)],
+        [xodr.LaneDef(10, 20, 2, 3, -sub_lane)],
+        30,
+        xodr.std_roadmark_solid(),
+        3,
+    )
+    assert lanes == lanes_wrong_sign
+    for side in ["rightlanes", "leftlanes"]:
+        previous_lanes = getattr(lanes_wrong_sign.lanesections[0], side)
+        split_lanes = getattr(lanes_wrong_sign.lanesections[1], side)
+        assert [len(lane.links.links) for lane in previous_lanes] == [1, 1]
+        assert [
+            abs(int(lane.get_linked_lane_id("successor")))
+            for lane in previous_lanes
+        ] == [1, 3]
+        assert split_lanes[1].get_linked_lane_id("predecessor") is None
+
+
+def test_create_lanes_merge_split_roadmarks_not_shared():
+    lanes = xodr.create_lanes_merge_split(
+        3, 2, 100, xodr.std_roadmark_solid(), 3
+    )
+    lanesection = lanes.lanesections[0]
+    roadmarks = [
+        lane.roadmark[0]
+        for lane in lanesection.rightlanes + lanesection.leftlanes
+    ]
+    assert len(set(id(roadmark) for roadmark in roadmarks)) == 5
+    assert roadmarks[0] == xodr.std_roadmark_broken()
+    assert roadmarks[0]._line[0] is not roadmarks[1]._line[0]
+    assert roadmarks[2] == xodr.std_roadmark_solid()
+
+
+def test_create_lanes_merge_split_center_roadmark():
+    center_road_mark = xodr.std_roadmark_solid_solid()
+    lanes = xodr.create_lanes_merge_split(
+        [xodr.LaneDef(10, 20, 2, 3, -1)], 2, 100, center_road_mark, 3
+    )
+    center_road_marks = [
+        lanesection.centerlane.roadmark[0]
+        for lanesection in lanes.lanesections
+    ]
+    assert len(center_road_marks) == 3
+    assert center_road_marks[0] is not center_road_mark
+    assert center_road_marks[0] == center_road_mark
+    assert center_road_marks[0] is center_road_marks[2]
+
+    center_road_mark = xodr.std_roadmark_broken()
+    lanes = xodr.create_lanes_merge_split(
+        [xodr.LaneDef(10, 20, 2, 3, -1)], 2, 100, center_road_mark, 3
+    )
+    center_road_marks = [
+        lanesection.centerlane.roadmark[0]
+        for lanesection in lanes.lanesections
+    ]
+    assert center_road_marks[0] == center_road_marks[2]
+    assert center_road_marks[0] is not center_road_marks[2]
+
+
+def test_lane_def_slots():
+    lane_def = xodr.LaneDef(0, 10, 2, 2)
+    assert not hasattr(lane_def, "__dict__")
+    with pytest.raises(AttributeError):
+        lane_def.n_lanes = 2
+
+
+def test_create_lanes_merge_split_constant_lanes():
+    lanes = xodr.create_lanes_merge_split(
+        3, 2, 100, xodr.std_roadmark_solid(), 3
+    )
+    lanes_from_lane_def = xodr.create_lanes_merge_split(
+        [xodr.LaneDef(0, 100, 3, 3)],
+        [xodr.LaneDef(0, 100, 2, 2)],
+        100,
+        xodr.std_roadmark_solid(),
+        3,
+    )
+    assert len(lanes.lanesections) == 1
+    lsec = lanes.lanesections[0]
+    lsec_from_lane_def = lanes_from_lane_def.lanesections[0]
+    for side, side_from_lane_def in [
+        (lsec.rightlanes, lsec_from_lane_def.rightlanes),
+        (lsec.leftlanes, lsec_from_lane_def.leftlanes),
+    ]:
+        assert len(side) == len(side_from_lane_def)
+        for lane, lane_from_lane_def in zip(side, side_from_lane_def):
+            for s in [0, 50, 100]:
+                assert lane.widths[0].get_width(s) == pytest.approx(
+                    lane_from_lane_def.widths[0].get_width(s)
+                )
+            assert lane.roadmark == lane_from_lane_def.roadmark
+
+
+def test_create_lanes_merge_split_constant_lanes_zero_length():
+    lanes = xodr.create_lanes_merge_split(
+        3, 2, 0, xodr.std_roadmark_solid(), 3
+    )
+    assert lanes.lanesections == []
@@ -65,3 +65,26 @@ def test_data_quality():
 
     assert dq == dq1
     assert dq != dq2
+
+
+def test_get_coeffs_for_poly3_batch():
+    coeffs = xodr.get_coeffs_for_poly3_batch(10, [3, 0, 3], [0, 3, 3])
+    assert coeffs.shape == (3, 4)
+    for coeff, (w_start, w_end) in zip(coeffs, [(3, 0), (0, 3), (3, 3)]):
+        assert coeff == pytest.approx(
+            xodr.get_coeffs_for_poly3(10, w_start, False, w_end), abs=1e-12
+        )
+
+
+def test_get_coeffs_for_poly3_batch_zero_length():
+    with pytest.raises(ValueError):
+        xodr.get_coeffs_for_poly3_batch(0, [3], [3])
+    with pytest.raises(ValueError):
+        xodr.get_coeffs_for_poly3_batch([10, -1], [3, 0], [3, 3])
+
+
+def test_get_coeffs_for_poly3_batch_shape_mismatch():
+    with pytest.raises(ValueError):
+        xodr.get_coeffs_for_poly3_batch(10, [3, 3], [4])
+    with pytest.raises(ValueError):
+        xodr.get_coeffs_for_poly3_batch(10, [3], [3, 4])